@@ -1,11 +1,22 @@
 """Blueprints.md - Markdown-to-code generation system."""
 
+from typing import Any
+
 __version__ = "0.1.0"
 
 from .parser import BlueprintParser, Blueprint, Component, BlueprintReference, Method
-from .generator import CodeGenerator
-from .resolver import BlueprintResolver, ResolvedBlueprint
-from .verifier import CodeVerifier, GenerationVerifier, VerificationResult
+
+# Generator/resolver/verifier pull in heavier dependencies (requests, config
+# parsing), so they are imported lazily via PEP 562: parser-only users never
+# pay for them.
+_LAZY_IMPORTS = {
+    "CodeGenerator": ("generator", "CodeGenerator"),
+    "BlueprintResolver": ("resolver", "BlueprintResolver"),
+    "ResolvedBlueprint": ("resolver", "ResolvedBlueprint"),
+    "CodeVerifier": ("verifier", "CodeVerifier"),
+    "GenerationVerifier": ("verifier", "GenerationVerifier"),
+    "VerificationResult": ("verifier", "VerificationResult"),
+}
 
 __all__ = [
     "BlueprintParser",
@@ -21,3 +32,16 @@ __all__ = [
     "VerificationResult",
     "__version__"
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    from importlib import import_module
+    return getattr(import_module(f".{module_name}", __name__), attr)
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
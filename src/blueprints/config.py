@@ -42,5 +42,21 @@ class BlueprintsConfig(BaseSettings):
         return os.environ.get("OPENROUTER_API_KEY")
 
 
-# Global config instance
-config = BlueprintsConfig.from_env()
\ No newline at end of file
+# Global config instance, created lazily so importing the package doesn't
+# pay for env/.env parsing unless the config is actually used.
+_config: Optional[BlueprintsConfig] = None
+
+
+def get_config() -> BlueprintsConfig:
+    """Get the global config instance, creating it on first use."""
+    global _config
+    if _config is None:
+        _config = BlueprintsConfig.from_env()
+    return _config
+
+
+def __getattr__(name: str) -> BlueprintsConfig:
+    # Keep `from .config import config` working without eager instantiation.
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 from .parser import Blueprint, Component
 from .resolver import BlueprintResolver, ResolvedBlueprint
-from .config import config as default_config
+from .config import get_config
 
 
 class CodeGenerator:
@@ -15,10 +15,11 @@ class CodeGenerator:
     
     def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
         """Initialize the code generator with an API key."""
+        default_config = get_config()
         self.api_key = api_key or default_config.get_api_key()
         if not self.api_key:
             raise ValueError("OpenRouter API key not provided. Set OPENROUTER_API_KEY environment variable or pass api_key parameter.")
-        
+
         self.client = None  # OpenRouter uses REST API, not a client object
         self.model = model or default_config.default_model
         self.max_tokens = default_config.max_tokens
@@ -206,7 +207,7 @@ class CodeGenerator:
                 context_parts.extend([
                     f"=== Module: {dep.module_name} ===",
                     "Blueprint:",
-                    dep.raw_content.strip(),
+                    dep.get_raw_content().strip(),
                     "",
                     "Generated code:",
                     generated_context[dep.module_name],
@@ -285,7 +286,7 @@ class CodeGenerator:
             for dep in resolved.dependencies:
                 context_parts.extend([
                     f"=== Blueprint: {dep.module_name} ===",
-                    dep.raw_content.strip(),
+                    dep.get_raw_content().strip(),
                     ""
                 ])
             
@@ -690,7 +691,7 @@ class CodeGenerator:
         env_vars = []
         
         # Parse setup blueprint content for dependencies and setup info
-        content_lines = setup_blueprint.raw_content.split('\n')
+        content_lines = setup_blueprint.get_raw_content().split('\n')
         in_third_party = False
         in_dev_deps = False
         in_installation = False
@@ -1,12 +1,46 @@
 """Compact blueprint parser module for extracting information from .md files."""
 
+import copy
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 
+# Interned component-type tokens: every Component stores one of these, and
+# downstream `component.type == "class"` checks hit the identity fast path.
+_T_CLASS = sys.intern('class')
+_T_FUNCTION = sys.intern('function')
+_T_CONSTANT = sys.intern('constant')
+_T_TYPE_ALIAS = sys.intern('type_alias')
+_T_AUTO = sys.intern('auto')
 
-@dataclass
+# Single alternation classifying a component head line in one regex call:
+# constant (NAME: type [= value]), standalone def, class head, or assignment
+# (type alias / bare constant). Alternatives are tried in order, so a line
+# pays for at most one match attempt instead of one per component kind.
+_COMPONENT_RE = re.compile(
+    r'^(?:'
+    r'(?P<const>[A-Z][A-Z0-9_]*):\s*(?P<const_type>[^=]+?)(?:\s*=\s*(?P<const_value>.+))?'
+    r'|(?:async\s+)?def\s+(?P<func>\w+)\((?P<func_params>.*)\)(?:\s*->\s*(?P<func_return>.+?))?:?'
+    r'|(?P<cls>\w+)(?:\((?P<cls_base>[^)]+)\))?:?'
+    r'|(?P<assign>[^=:]+?)\s*=\s*(?P<assign_value>.+?)'
+    r')\s*$'
+)
+# Greedy params pair with the last ')', so nested parens in defaults stay in
+# the params group with linear-bounded backtracking (a single unnested
+# quantifier cannot go catastrophic).
+_METHOD_RE = re.compile(r'^(?:(async)\s+)?(\w+)\((.*)\)(?:\s*->\s*(.+))?$')
+
+# Comma-separated items with surrounding whitespace trimmed, in one findall
+# instead of split(',') plus a strip per item.
+_CSV_ITEMS_RE = re.compile(r'[^,\s][^,]*[^,\s]|[^,\s]')
+
+
+@dataclass(slots=True)
 class Method:
     """Represents a method or function signature."""
     name: str
@@ -17,7 +51,7 @@ class Method:
     is_async: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Component:
     """Represents a component (class, function, etc.) in a blueprint."""
     type: str  # "class", "function", "constant", "type_alias"
@@ -29,14 +63,14 @@ class Component:
     docstring: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BlueprintReference:
     """Represents a reference to another blueprint."""
     module_path: str
     items: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Blueprint:
     """Represents a parsed compact blueprint file."""
     module_name: str
@@ -44,67 +78,152 @@ class Blueprint:
     blueprint_refs: List[BlueprintReference] = field(default_factory=list)  # references to other blueprints
     components: List[Component] = field(default_factory=list)
     notes: List[str] = field(default_factory=list)
-    raw_content: str = ""
+    raw_content: Optional[str] = None
     file_path: Optional[Path] = None
 
+    def get_raw_content(self) -> str:
+        """Get the blueprint source text, re-reading the file if needed."""
+        if self.raw_content is None:
+            if self.file_path is None:
+                raise ValueError(
+                    f"Blueprint {self.module_name} has no raw content and no file path"
+                )
+            with self.file_path.open('r', encoding='utf-8', newline='') as f:
+                self.raw_content = f.read()
+        return self.raw_content
+
 
 class CompactBlueprintParser:
     """Parses compact blueprint markdown files into structured data."""
-    
-    def parse_file(self, file_path: Path) -> Blueprint:
-        """Parse a blueprint file and return structured data."""
-        content = file_path.read_text()
-        blueprint = self.parse_content(content)
+
+    def __init__(self) -> None:
+        """Initialize the parser with an empty file-parse cache."""
+        self._cache: Dict[Tuple[str, int, int], Blueprint] = {}
+
+    def parse_file(self, file_path: Path, include_raw: bool = False) -> Blueprint:
+        """Parse a blueprint file and return structured data.
+
+        Results are memoized by (path, mtime, size), so re-parsing an
+        unchanged file skips the parse; each call returns a fresh copy
+        that the caller is free to mutate. The source text is not retained
+        unless include_raw is set; get_raw_content() re-reads it on demand.
+        """
+        st = file_path.stat()
+        key = (str(file_path), st.st_mtime_ns, st.st_size)
+        cached = self._cache.get(key)
+        if cached is not None:
+            blueprint = copy.deepcopy(cached)
+            if include_raw and blueprint.raw_content is None:
+                # Honor include_raw even when the file was first parsed
+                # without it; get_raw_content re-reads and retains the text.
+                blueprint.get_raw_content()
+            return blueprint
+
+        # Explicit UTF-8 read; read_text() falls back to the locale encoding
+        with file_path.open('r', encoding='utf-8', newline='') as f:
+            content = f.read()
+        blueprint = self.parse_content(content, include_raw=include_raw)
         blueprint.file_path = file_path
+        # Cache a private copy, without the source text so the cache stays
+        # lean; include_raw hits re-read lazily above.
+        stored = copy.deepcopy(blueprint)
+        stored.raw_content = None
+        self._cache[key] = stored
         return blueprint
     
-    def parse_content(self, content: str) -> Blueprint:
-        """Parse compact blueprint content and return structured data."""
-        lines = content.strip().split('\n')
-        
+    @classmethod
+    def parse_many(cls, paths: List[Path], workers: Optional[int] = None) -> List[Blueprint]:
+        """Parse many blueprint files across worker processes.
+
+        Files are independent and parsing is CPU-bound, so this scales
+        near-linearly on large corpora. Small batches (or workers=1) are
+        parsed in-process to skip the pool startup cost.
+        """
+        if len(paths) <= 1 or workers == 1:
+            parser = cls()
+            return [parser.parse_file(p) for p in paths]
+
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            return list(executor.map(_parse_one, paths, chunksize=8))
+
+    def parse_content(self, content: str, include_raw: bool = False) -> Blueprint:
+        """Parse compact blueprint content and return structured data.
+
+        Identical content strings short-circuit through an LRU cache; the
+        result is deep-copied so callers are free to mutate it. Set
+        include_raw to keep the source text on the returned Blueprint.
+        """
+        return copy.deepcopy(_parse_content_cached(content, include_raw))
+
+    def _parse_content_uncached(self, content: str, include_raw: bool) -> Blueprint:
+        """Parse blueprint content without consulting the content cache."""
+        # splitlines() handles \r\n uniformly and avoids the whole-string
+        # copy of content.strip(). Strip each line once; indentation is
+        # never significant in the compact format.
+        stripped = [l.strip() for l in content.splitlines()]
+        while stripped and not stripped[0]:
+            stripped.pop(0)
+        while stripped and not stripped[-1]:
+            stripped.pop()
+
         # Extract module name and description from first two lines
-        if not lines or not lines[0].startswith('#'):
+        if not stripped or not stripped[0].startswith('#'):
             raise ValueError("Blueprint must start with # module.name")
-        
-        module_name = lines[0].strip('#').strip()
-        description = lines[1].strip() if len(lines) > 1 else ""
+
+        module_name = stripped[0].strip('#').strip()
+        description = stripped[1] if len(stripped) > 1 else ""
         
         blueprint = Blueprint(
             module_name=module_name,
             description=description,
-            raw_content=content
+            raw_content=content if include_raw else None
         )
         
         # Parse the rest of the content
         i = 2
-        while i < len(lines):
-            line = lines[i].strip()
-            
+        pending_decorators: List[str] = []
+        while i < len(stripped):
+            line = stripped[i]
+
             if line.startswith('deps:'):
                 # Parse only blueprint references (ignore standard/3rd party deps)
                 deps_str = line[5:].strip()
                 refs = self._parse_blueprint_refs(deps_str)
                 blueprint.blueprint_refs = refs
                 i += 1
-                
+
             elif line.startswith('notes:'):
                 # Parse notes
-                notes_str = line[6:].strip()
-                blueprint.notes = [n.strip() for n in notes_str.split(',')]
+                blueprint.notes = _CSV_ITEMS_RE.findall(line[6:])
                 i += 1
-                
+
+            elif line.startswith('@'):
+                # Accumulate decorators for a following standalone function
+                pending_decorators.append(line)
+                i += 1
+                continue
+
+            elif line.startswith('-'):
+                # Member bullet outside a class body; cannot start a
+                # component, so skip it without a regex call.
+                i += 1
+
             elif line and not line.startswith('#'):
-                # Parse component
-                component = self._parse_component(lines, i)
+                # Parse component; end index tells us how far it consumed
+                component, end_idx = self._parse_component(stripped, i)
                 if component:
+                    if pending_decorators and component.type == _T_FUNCTION:
+                        component.methods[0].decorators.extend(pending_decorators)
                     blueprint.components.append(component)
-                    # Skip lines that belong to this component
-                    i = self._find_component_end(lines, i) + 1
+                    i = end_idx + 1
                 else:
                     i += 1
             else:
                 i += 1
-        
+
+            # Any non-decorator line breaks the pending decorator chain
+            pending_decorators.clear()
+
         return blueprint
     
     def _parse_blueprint_refs(self, deps_str: str) -> List[BlueprintReference]:
@@ -118,16 +237,14 @@ class CompactBlueprintParser:
                 continue
             
             # Only process blueprint references (starting with @ or .)
-            if dep.startswith('.') or dep.startswith('@'):
-                # Check if it has items in brackets
-                if '[' in dep and ']' in dep:
-                    package = dep[:dep.index('[')].strip()
-                    items_str = dep[dep.index('[')+1:dep.index(']')]
-                    items = [item.strip() for item in items_str.split(',')]
-                    
+            if dep.startswith(('.', '@')):
+                # Check if it has items in brackets; partition scans once
+                package, bracket, rest = dep.partition('[')
+                if bracket and ']' in rest:
+                    items = _CSV_ITEMS_RE.findall(rest.partition(']')[0])
+
                     # Remove @ prefix if present
-                    if package.startswith('@'):
-                        package = package[1:]
+                    package = package.strip().removeprefix('@')
                     blueprint_refs.append(BlueprintReference(module_path=package, items=items))
                 else:
                     # Just a blueprint module name
@@ -136,117 +253,133 @@ class CompactBlueprintParser:
         
         return blueprint_refs
     
-    def _parse_component(self, lines: List[str], start_idx: int) -> Optional[Component]:
-        """Parse a component starting at the given line."""
-        line = lines[start_idx].strip()
-        
-        # Check for type alias (TypeName = Type or explicit type alias)
-        # Skip lines with ':' in left-hand side as they should be handled by constant regex
-        if '=' in line and not line.startswith('-'):
-            parts = line.split('=', 1)
-            if len(parts) == 2:
-                name = parts[0].strip()
-                value = parts[1].strip()
-                # Skip if left-hand side contains ':' (let constant regex handle it)
-                if ':' not in name:
-                    # Only treat as type alias if name is PascalCase or contains "type" keyword
-                    if (name[0].isupper() and any(c.islower() for c in name)) or 'type' in name.lower():
-                        return Component(type="type_alias", name=name, value=value)
-                    # Otherwise treat as constant if it looks like one
-                    elif name.isupper() and '_' in name:
-                        return Component(
-                            type="constant",
-                            name=name,
-                            properties={"type": "auto"},
-                            value=value
-                        )
-        
-        # Check for constant (CONSTANT_NAME: type = value)
-        if re.match(r'^[A-Z][A-Z0-9_]*:', line):
-            match = re.match(r'^([A-Z][A-Z0-9_]*):\s*([^=]+)(?:\s*=\s*(.+))?$', line)
-            if match:
-                name, type_str, value = match.groups()
-                return Component(
-                    type="constant",
-                    name=name,
-                    properties={"type": type_str.strip()},
-                    value=value.strip() if value else None
-                )
-        
-        # Check for class definition
-        class_match = re.match(r'^(\w+)(?:\(([^)]+)\))?:?\s*$', line)
-        if class_match and start_idx + 1 < len(lines) and lines[start_idx + 1].strip().startswith('-'):
-            name, base_class = class_match.groups()
-            component = Component(
-                type="class",
-                name=name,
-                base_class=base_class
-            )
-            
-            # Parse class members
-            i = start_idx + 1
-            decorators = []
-            while i < len(lines) and (lines[i].strip().startswith('-') or
-                                     lines[i].strip().startswith('@') or
-                                     not lines[i].strip()):
-                member_line = lines[i].strip()
-                if member_line.startswith('-'):
-                    method = self._parse_method(member_line[1:].strip())
-                    if method:
-                        # Apply accumulated decorators
-                        method.decorators.extend(decorators)
-                        component.methods.append(method)
-                        decorators = []  # Reset decorators
-                elif member_line.startswith('@'):
-                    # Accumulate decorators
-                    decorators.append(member_line)
-                i += 1
-            
-            return component
-        
-        # Check for standalone function (with decorator support)
-        func_match = re.match(r'^(?:async\s+)?def\s+(\w+)\((.*?)\)(?:\s*->\s*(.+?))?:?\s*$', line)
-        if func_match:
-            is_async = line.strip().startswith('async ')
-            name, params, return_type = func_match.groups()
-            
-            # Check for preceding decorators
-            decorators = []
-            check_idx = start_idx - 1
-            while check_idx >= 0 and lines[check_idx].strip().startswith('@'):
-                decorators.insert(0, lines[check_idx].strip())
-                check_idx -= 1
-            
+    def _parse_component(self, stripped: List[str], start_idx: int) -> Tuple[Optional[Component], int]:
+        """Parse a component starting at the given line.
+
+        Expects pre-stripped lines. Returns the component (or None) together
+        with the index of the last line it consumed, so the caller can
+        continue without re-scanning.
+        """
+        line = stripped[start_idx]
+
+        match = _COMPONENT_RE.match(line)
+        if not match:
+            return None, start_idx
+
+        # Constant (CONSTANT_NAME: type = value)
+        if match.group('const') is not None:
+            value = match.group('const_value')
+            return Component(
+                type=_T_CONSTANT,
+                name=match.group('const'),
+                properties={"type": match.group('const_type').strip()},
+                value=value.strip() if value else None
+            ), start_idx
+
+        # Standalone function (decorators are attached by the caller)
+        if match.group('func') is not None:
+            name = match.group('func')
+            return_type = match.group('func_return')
+
             # Check for docstring
             docstring = None
-            if start_idx + 1 < len(lines) and lines[start_idx + 1].strip().startswith('"""'):
-                docstring = lines[start_idx + 1].strip().strip('"""')
-            
+            end_idx = start_idx
+            if start_idx + 1 < len(stripped) and stripped[start_idx + 1].startswith('"""'):
+                docstring = stripped[start_idx + 1].strip('"""')
+                end_idx = start_idx + 1
+
             method = Method(
                 name=name,
-                params=params,
+                params=match.group('func_params'),
                 return_type=return_type.strip() if return_type else None,
-                is_async=is_async,
-                decorators=decorators
+                is_async=line.startswith('async ')
             )
-            
+
             return Component(
-                type="function",
+                type=_T_FUNCTION,
                 name=name,
                 methods=[method],
                 docstring=docstring
+            ), end_idx
+
+        # Class definition (confirmed by a following member line)
+        if match.group('cls') is not None:
+            if start_idx + 1 >= len(stripped) or not stripped[start_idx + 1].startswith('-'):
+                return None, start_idx
+            component = Component(
+                type=_T_CLASS,
+                name=match.group('cls'),
+                base_class=match.group('cls_base')
             )
-        
-        return None
+
+            # Parse class members, dispatching on the first character.
+            # parse_method is bound locally to keep the hot loop on LOAD_FAST.
+            parse_method = self._parse_method
+            n = len(stripped)
+            i = start_idx + 1
+            decorators: List[str] = []
+            decorators_start = -1
+            while i < n:
+                member_line = stripped[i]
+                if not member_line:
+                    i += 1
+                    continue
+                kind = member_line[0]
+                if kind == '-':
+                    member = parse_method(member_line[1:].lstrip())
+                    if member:
+                        # Apply accumulated decorators
+                        member.decorators.extend(decorators)
+                        component.methods.append(member)
+                        decorators = []  # Reset decorators
+                        decorators_start = -1
+                elif kind == '@':
+                    # Accumulate decorators
+                    if not decorators:
+                        decorators_start = i
+                    decorators.append(member_line)
+                else:
+                    break
+                i += 1
+
+            # Trailing decorators belong to whatever follows the class (e.g.
+            # a standalone function); rewind so the main loop re-reads them.
+            if decorators:
+                return component, decorators_start - 1
+
+            return component, i - 1
+
+        # Assignment: type alias (TypeName = Type) or bare constant
+        if match.group('assign') is not None:
+            name = match.group('assign')
+            value = match.group('assign_value')
+            # Only treat as type alias if name is PascalCase or contains "type" keyword
+            if (name[0].isupper() and any(c.islower() for c in name)) or 'type' in name.lower():
+                return Component(type=_T_TYPE_ALIAS, name=name, value=value), start_idx
+            # Otherwise treat as constant if it looks like one
+            elif name.isupper() and '_' in name:
+                return Component(
+                    type=_T_CONSTANT,
+                    name=name,
+                    properties={"type": _T_AUTO},
+                    value=value
+                ), start_idx
+
+        return None, start_idx
     
     def _parse_method(self, line: str) -> Optional[Method]:
         """Parse a method signature line."""
-        # Remove comments first
+        # Remove comments first; slice only on a hit to avoid allocating
         comment = None
-        if '#' in line:
-            parts = line.split('#', 1)
-            line = parts[0].strip()
-            comment = parts[1].strip()
+        idx = line.find('#')
+        if idx >= 0:
+            # A quote before the hash means it may sit inside a string
+            # default, so fall back to the quote-tracking scan.
+            if '"' in line[:idx] or "'" in line[:idx]:
+                idx = _find_comment_start(line)
+            if idx >= 0:
+                comment = line[idx + 1:].strip()
+                line = line[:idx].rstrip()
         
         # Check for property
         if ':' in line and '(' not in line:
@@ -259,47 +392,47 @@ class CompactBlueprintParser:
             )
         
         # Parse method signature
-        match = re.match(r'^(?:async\s+)?(\w+)\((.*?)\)(?:\s*->\s*(.+))?$', line)
+        match = _METHOD_RE.match(line)
         if match:
-            name, params, return_type = match.groups()
+            is_async, name, params, return_type = match.groups()
             return Method(
                 name=name,
                 params=params,
                 return_type=return_type.strip() if return_type else None,
                 comment=comment,
-                is_async=line.strip().startswith('async ')
+                is_async=is_async is not None
             )
-        
+
         return None
-    
-    def _find_component_end(self, lines: List[str], start_idx: int) -> int:
-        """Find where a component definition ends."""
-        i = start_idx + 1
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Skip empty lines and docstrings
-            if not line or line.startswith('"""'):
-                i += 1
-                continue
-                
-            # Component ends when we hit a directive or what looks like a new component
-            if (line.startswith('deps:') or
-                line.startswith('notes:') or
-                line.startswith('#')):
-                return i - 1
-                
-            # Check if this looks like a new component (not part of current one)
-            if (line and not line.startswith('-') and not line.startswith('@')):
-                # Could be a new function, class, constant, or type alias
-                if (re.match(r'^(?:async\s+)?def\s+\w+\(', line) or  # function
-                    re.match(r'^\w+(?:\([^)]*\))?:?\s*$', line) or  # class
-                    re.match(r'^[A-Z][A-Z0-9_]*:', line) or  # constant
-                    ('=' in line and not line.startswith('-'))):  # type alias or assignment
-                    return i - 1
-            
-            i += 1
-        return len(lines) - 1
+
+
+def _parse_one(file_path: Path) -> Blueprint:
+    """Parse a single blueprint file; top-level so it pickles for workers."""
+    return CompactBlueprintParser().parse_file(file_path)
+
+
+def _find_comment_start(line: str) -> int:
+    """Return the index of the first '#' outside quotes, or -1."""
+    quote = ''
+    for i, ch in enumerate(line):
+        if quote:
+            if ch == quote:
+                quote = ''
+        elif ch == '"' or ch == "'":
+            quote = ch
+        elif ch == '#':
+            return i
+    return -1
+
+
+@lru_cache(maxsize=128)
+def _parse_content_cached(content: str, include_raw: bool) -> Blueprint:
+    """Parse content, memoized on the content string itself."""
+    return _content_parser._parse_content_uncached(content, include_raw)
+
+
+# Stateless helper instance backing the content cache
+_content_parser = CompactBlueprintParser()
 
 
 # Update the existing BlueprintParser to use CompactBlueprintParser
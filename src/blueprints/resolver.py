@@ -235,12 +235,12 @@ class BlueprintResolver:
             context_parts.append("=== REFERENCED BLUEPRINTS ===\n")
             for dep in resolved.dependencies:
                 context_parts.append(f"--- {dep.module_name} ---")
-                context_parts.append(dep.raw_content.strip())
+                context_parts.append(dep.get_raw_content().strip())
                 context_parts.append("")
         
         # Add main blueprint
         context_parts.append("=== MAIN BLUEPRINT TO IMPLEMENT ===\n")
-        context_parts.append(resolved.main.raw_content.strip())
+        context_parts.append(resolved.main.get_raw_content().strip())
         
         return "\n".join(context_parts)
     